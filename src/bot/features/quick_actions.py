@@ -4,8 +4,10 @@ Provides context-aware quick action suggestions for common development tasks.
 """
 
 import logging
+import os
+import stat
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
@@ -13,6 +15,18 @@ from src.storage.models import SessionModel
 
 logger = logging.getLogger(__name__)
 
+# Flags that message keywords can set
+_CTX_FLAGS = (
+    "has_tests",
+    "has_package_manager",
+    "has_dependencies",
+    "has_formatter",
+    "has_linter",
+)
+
+# Maximum number of working directories whose context is cached
+_DIR_CONTEXT_CACHE_SIZE = 64
+
 
 @dataclass
 class QuickAction:
@@ -24,9 +38,13 @@ class QuickAction:
     command: str
     icon: str
     category: str
-    context_required: List[str]  # Required context keys
+    context_required: FrozenSet[str]  # Required context keys
     priority: int = 0  # Higher = more important
 
+    def __post_init__(self) -> None:
+        """Normalize required keys to a frozenset for subset checks."""
+        self.context_required = frozenset(self.context_required)
+
 
 class QuickActionManager:
     """Manages quick action suggestions based on context."""
@@ -34,7 +52,20 @@ class QuickActionManager:
     def __init__(self) -> None:
         """Initialize the quick action manager."""
         self.actions = self._create_default_actions()
+        # Priorities are static, so sort once (highest first)
+        self._actions_sorted = sorted(
+            self.actions.values(), key=lambda x: x.priority, reverse=True
+        )
+        # Buttons are immutable, so build them once per action
+        self._buttons: Dict[str, InlineKeyboardButton] = {
+            action_id: self._create_button(action)
+            for action_id, action in self.actions.items()
+        }
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        # (working_directory, mtime_ns) -> analyzed context
+        self._dir_context_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        # Active context flags -> available actions sorted by priority
+        self._suggestion_cache: Dict[FrozenSet[str], List[QuickAction]] = {}
 
     def _create_default_actions(self) -> Dict[str, QuickAction]:
         """Create default quick actions."""
@@ -46,7 +77,7 @@ class QuickActionManager:
                 command="test",
                 icon="🧪",
                 category="testing",
-                context_required=["has_tests"],
+                context_required=frozenset({"has_tests"}),
                 priority=10,
             ),
             "install": QuickAction(
@@ -56,7 +87,7 @@ class QuickActionManager:
                 command="install",
                 icon="📦",
                 category="setup",
-                context_required=["has_package_manager"],
+                context_required=frozenset({"has_package_manager"}),
                 priority=9,
             ),
             "format": QuickAction(
@@ -66,7 +97,7 @@ class QuickActionManager:
                 command="format",
                 icon="🎨",
                 category="quality",
-                context_required=["has_formatter"],
+                context_required=frozenset({"has_formatter"}),
                 priority=7,
             ),
             "lint": QuickAction(
@@ -76,7 +107,7 @@ class QuickActionManager:
                 command="lint",
                 icon="🔍",
                 category="quality",
-                context_required=["has_linter"],
+                context_required=frozenset({"has_linter"}),
                 priority=8,
             ),
             "security": QuickAction(
@@ -86,7 +117,7 @@ class QuickActionManager:
                 command="security",
                 icon="🔒",
                 category="security",
-                context_required=["has_dependencies"],
+                context_required=frozenset({"has_dependencies"}),
                 priority=6,
             ),
             "optimize": QuickAction(
@@ -96,7 +127,7 @@ class QuickActionManager:
                 command="optimize",
                 icon="⚡",
                 category="performance",
-                context_required=["has_code"],
+                context_required=frozenset({"has_code"}),
                 priority=5,
             ),
             "document": QuickAction(
@@ -106,7 +137,7 @@ class QuickActionManager:
                 command="document",
                 icon="📝",
                 category="documentation",
-                context_required=["has_code"],
+                context_required=frozenset({"has_code"}),
                 priority=4,
             ),
             "refactor": QuickAction(
@@ -116,7 +147,7 @@ class QuickActionManager:
                 command="refactor",
                 icon="🔧",
                 category="quality",
-                context_required=["has_code"],
+                context_required=frozenset({"has_code"}),
                 priority=3,
             ),
         }
@@ -144,14 +175,18 @@ class QuickActionManager:
             else:
                 context = {"has_code": True}
 
-            # Filter actions based on context
-            available_actions = []
-            for action in self.actions.values():
-                if self._is_action_available(action, context):
-                    available_actions.append(action)
-
-            # Sort by priority and return top N
-            available_actions.sort(key=lambda x: x.priority, reverse=True)
+            # Filtering only depends on which flags are set
+            active = frozenset(key for key, value in context.items() if value)
+            available_actions = self._suggestion_cache.get(active)
+            if available_actions is None:
+                available_actions = [
+                    action
+                    for action in self._actions_sorted
+                    if self._is_action_available(action, active)
+                ]
+                self._suggestion_cache[active] = available_actions
+
+            # Return top N by priority
             return available_actions[:limit]
 
         except Exception as e:
@@ -183,24 +218,34 @@ class QuickActionManager:
                 content = msg.get("content", "").lower()
 
                 # Check for test indicators
-                if any(word in content for word in ["test", "pytest", "unittest"]):
+                if not context["has_tests"] and any(
+                    word in content for word in ("test", "pytest", "unittest")
+                ):
                     context["has_tests"] = True
 
                 # Check for package manager indicators
-                if any(word in content for word in ["pip", "poetry", "npm", "yarn"]):
+                if not context["has_package_manager"] and any(
+                    word in content for word in ("pip", "poetry", "npm", "yarn")
+                ):
                     context["has_package_manager"] = True
                     context["has_dependencies"] = True
 
                 # Check for formatter indicators
-                if any(word in content for word in ["black", "prettier", "format"]):
+                if not context["has_formatter"] and any(
+                    word in content for word in ("black", "prettier", "format")
+                ):
                     context["has_formatter"] = True
 
                 # Check for linter indicators
-                if any(
-                    word in content for word in ["flake8", "pylint", "eslint", "mypy"]
+                if not context["has_linter"] and any(
+                    word in content for word in ("flake8", "pylint", "eslint", "mypy")
                 ):
                     context["has_linter"] = True
 
+                # Remaining messages cannot change anything
+                if all(context[key] for key in _CTX_FLAGS):
+                    break
+
         # File-based context analysis could be added here
         # For now, we'll use heuristics based on session history
 
@@ -215,9 +260,6 @@ class QuickActionManager:
         Returns:
             Context dictionary
         """
-        import os
-        from pathlib import Path
-
         context = {
             "has_code": True,
             "has_tests": False,
@@ -228,47 +270,79 @@ class QuickActionManager:
         }
 
         working_dir = session_data.get("working_directory")
-        if working_dir and os.path.isdir(working_dir):
-            path = Path(working_dir)
-            files = [f.name for f in path.iterdir() if f.is_file()]
-            dirs = [d.name for d in path.iterdir() if d.is_dir()]
-
-            # Check for tests
-            if "tests" in dirs or "test" in dirs or any("test" in f for f in files):
-                context["has_tests"] = True
-
-            # Check for package managers
-            if "pyproject.toml" in files or "requirements.txt" in files:
-                context["has_package_manager"] = True
-                context["has_dependencies"] = True
-            if "package.json" in files:
-                context["has_package_manager"] = True
-                context["has_dependencies"] = True
-
-            # Check for formatters/linters
-            if "pyproject.toml" in files or ".flake8" in files or ".pylintrc" in files:
-                context["has_linter"] = True
-                context["has_formatter"] = True
+        if not working_dir:
+            return context
+
+        try:
+            dir_stat = os.stat(working_dir)
+        except OSError:
+            return context
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            return context
+
+        # Directory mtime changes whenever entries are added or removed
+        cache_key = (working_dir, dir_stat.st_mtime_ns)
+        cached = self._dir_context_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        # Single directory scan; DirEntry caches the file type
+        files, dirs = set(), set()
+        has_test_file = False
+        with os.scandir(working_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dirs.add(entry.name)
+                elif entry.is_file():
+                    files.add(entry.name)
+                    if not has_test_file and "test" in entry.name:
+                        has_test_file = True
+
+        # Check for tests
+        if "tests" in dirs or "test" in dirs or has_test_file:
+            context["has_tests"] = True
+
+        # Check for package managers
+        if "pyproject.toml" in files or "requirements.txt" in files:
+            context["has_package_manager"] = True
+            context["has_dependencies"] = True
+        if "package.json" in files:
+            context["has_package_manager"] = True
+            context["has_dependencies"] = True
+
+        # Check for formatters/linters
+        if "pyproject.toml" in files or ".flake8" in files or ".pylintrc" in files:
+            context["has_linter"] = True
+            context["has_formatter"] = True
+
+        if len(self._dir_context_cache) >= _DIR_CONTEXT_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._dir_context_cache[next(iter(self._dir_context_cache))]
+        self._dir_context_cache[cache_key] = dict(context)
 
         return context
 
     def _is_action_available(
-        self, action: QuickAction, context: Dict[str, Any]
+        self, action: QuickAction, active_keys: FrozenSet[str]
     ) -> bool:
         """Check if an action is available in the given context.
 
         Args:
             action: The action to check
-            context: Current context
+            active_keys: Context keys that are currently set
 
         Returns:
             True if action is available
         """
-        # Check all required context keys
-        for key in action.context_required:
-            if not context.get(key, False):
-                return False
-        return True
+        return action.context_required <= active_keys
+
+    @staticmethod
+    def _create_button(action: QuickAction) -> InlineKeyboardButton:
+        """Create the inline keyboard button for an action."""
+        return InlineKeyboardButton(
+            text=f"{action.icon} {action.name}",
+            callback_data=f"quick_action:{action.id}",
+        )
 
     def create_inline_keyboard(
         self, actions: List[QuickAction], columns: int = 2
@@ -286,10 +360,7 @@ class QuickActionManager:
         row = []
 
         for i, action in enumerate(actions):
-            button = InlineKeyboardButton(
-                text=f"{action.icon} {action.name}",
-                callback_data=f"quick_action:{action.id}",
-            )
+            button = self._buttons.get(action.id) or self._create_button(action)
             row.append(button)
 
             # Add row when full or last item
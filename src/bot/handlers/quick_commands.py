@@ -3,12 +3,17 @@
 These commands query local databases/APIs directly for speed.
 """
 
+import asyncio
+import contextlib
 import json
+import os
 import re
 import sqlite3
-import subprocess
+import time
 from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
+from typing import Awaitable, Callable, Dict, Tuple
 
 import structlog
 from telegram import Update
@@ -22,34 +27,140 @@ CALCOM_CLI = Path.home() / ".claude/bin/calcom-cli"
 # Database paths
 GROCERIES_DB = Path("/Users/joppa/eobsidian/02_Areas/Family/groceries.db")
 
+# Precompiled patterns for _parse_natural_time and schedule_command
+_IN_HOURS_RE = re.compile(r'in\s+(\d+)\s*hours?')
+_TIME_PATTERNS = (
+    # "at HH:MM" or "at Hpm/am"
+    re.compile(r'at\s+(\d{1,2}):?(\d{2})?\s*(am|pm)?'),
+    # "HH:MM" standalone or "Hpm/am"
+    re.compile(r'(\d{1,2}):(\d{2})\s*(am|pm)?'),
+    re.compile(r'(\d{1,2})\s*(am|pm)'),
+)
+# Day words (today, tomorrow, weekdays)
+_DAY_WORDS = r'today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday'
+_DAY_RE = re.compile(rf'(?P<day>{_DAY_WORDS})')
+_WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6,
+}
+# Day words and time expressions removed from the title, in a single pass
+_STRIP_ALL_RE = re.compile(
+    rf'(?:\bat\s+)?(?:next\s+)?(?:{_DAY_WORDS})'
+    r'|at\s+\d{1,2}:?\d{0,2}\s*(?:am|pm)?'
+    r'|\d{1,2}:\d{2}\s*(?:am|pm)?'
+    r'|\d{1,2}\s*(?:am|pm)'
+)
+_FAMILY_RE = re.compile(r'--family', re.IGNORECASE)
+
+# Covering indexes so the /groceries aggregates avoid full row scans
+_GROCERIES_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_purchases_store
+    ON purchases(store, price, quantity, date, email_id);
+CREATE INDEX IF NOT EXISTS idx_purchases_date
+    ON purchases(date DESC, id DESC, store, product, price, quantity);
+CREATE INDEX IF NOT EXISTS idx_purchases_product
+    ON purchases(product, price, quantity);
+ANALYZE;
+"""
+_GROCERIES_INDEX_NAMES = frozenset(
+    {"idx_purchases_store", "idx_purchases_date", "idx_purchases_product"}
+)
+
+# Formatted /groceries replies:
+# query helper -> ((db st_ino, st_mtime_ns), cached_at, text)
+_GROCERIES_CACHE: Dict[
+    Callable[..., Awaitable[str]], Tuple[Tuple[int, int], float, str]
+] = {}
+_GROCERIES_CACHE_TTL = 300  # seconds
+
+# Shared read-only connection to the groceries database (opened lazily),
+# plus the (st_dev, st_ino) of the file it was opened on
+_GROCERIES_CONN: sqlite3.Connection | None = None
+_GROCERIES_CONN_FILE: tuple[int, int] | None = None
+
+
+def _ensure_groceries_indexes() -> None:
+    """Create the groceries indexes if the database is writable."""
+    try:
+        conn = sqlite3.connect(GROCERIES_DB)
+        try:
+            existing = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+            # Only write (and re-ANALYZE) when an index is actually missing
+            if not _GROCERIES_INDEX_NAMES <= existing:
+                conn.executescript(_GROCERIES_INDEXES)
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        # Read-only or locked database: queries still work, just slower
+        logger.warning("Could not create groceries indexes", error=str(e))
+
+
+def _get_groceries_conn(db_stat: os.stat_result) -> sqlite3.Connection:
+    """Return the shared read-only groceries connection.
+
+    The connection is opened on first use and reopened when db_stat shows the
+    database file was replaced (e.g. an import that renames a new file over
+    it), since an open connection keeps reading the old, unlinked file.
+    """
+    global _GROCERIES_CONN, _GROCERIES_CONN_FILE
+    file_id = (db_stat.st_dev, db_stat.st_ino)
+    if _GROCERIES_CONN is not None and _GROCERIES_CONN_FILE != file_id:
+        _GROCERIES_CONN.close()
+        _GROCERIES_CONN = None
+    if _GROCERIES_CONN is None:
+        _ensure_groceries_indexes()
+        conn = sqlite3.connect(
+            f"{GROCERIES_DB.as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        # Read pages through mmap (1 GiB cap) and keep them cached across
+        # commands; sort/DISTINCT temp b-trees stay in memory
+        conn.execute("PRAGMA mmap_size=1073741824")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA query_only=1")
+        _GROCERIES_CONN = conn
+        _GROCERIES_CONN_FILE = file_id
+    return _GROCERIES_CONN
+
 
 async def groceries_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /groceries command - instant grocery stats."""
-    args = " ".join(context.args) if context.args else ""
+    args = " ".join(context.args).lower() if context.args else ""
 
-    if not GROCERIES_DB.exists():
+    # One stat serves the existence check, the cache key and the connection
+    try:
+        db_stat = GROCERIES_DB.stat()
+    except FileNotFoundError:
         await update.message.reply_text(
             "❌ **Grocery Database Not Found**\n\n"
             f"Expected at: `{GROCERIES_DB}`"
         )
         return
 
-    try:
-        conn = sqlite3.connect(GROCERIES_DB)
-        conn.row_factory = sqlite3.Row
+    if args in ["", "summary", "stats"]:
+        # Default: Show summary
+        query = _groceries_summary
+    elif args.startswith("store"):
+        query = _groceries_by_store
+    elif args.startswith("month"):
+        query = _groceries_monthly
+    elif args.startswith("top"):
+        query = _groceries_top_products
+    elif args.startswith("recent"):
+        query = _groceries_recent
+    else:
+        query = None
 
-        if args.lower() in ["", "summary", "stats"]:
-            # Default: Show summary
-            result = await _groceries_summary(conn)
-        elif args.lower().startswith("store"):
-            result = await _groceries_by_store(conn)
-        elif args.lower().startswith("month"):
-            result = await _groceries_monthly(conn)
-        elif args.lower().startswith("top"):
-            result = await _groceries_top_products(conn)
-        elif args.lower().startswith("recent"):
-            result = await _groceries_recent(conn)
-        else:
+    try:
+        if query is None:
             result = (
                 "📊 **Grocery Commands**\n\n"
                 "• `/groceries` - Summary stats\n"
@@ -59,8 +170,22 @@ async def groceries_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
                 "• `/groceries recent` - Recent purchases\n\n"
                 "_For complex queries, just ask me naturally!_"
             )
+        else:
+            # Serve from cache while the database file is unchanged (same
+            # inode, so not replaced, and same mtime, so not written to)
+            version = (db_stat.st_ino, db_stat.st_mtime_ns)
+            now = time.monotonic()
+            cached = _GROCERIES_CACHE.get(query)
+            if (
+                cached
+                and cached[0] == version
+                and now - cached[1] < _GROCERIES_CACHE_TTL
+            ):
+                result = cached[2]
+            else:
+                result = await query(_get_groceries_conn(db_stat))
+                _GROCERIES_CACHE[query] = (version, now, result)
 
-        conn.close()
         await update.message.reply_text(result, parse_mode="Markdown")
 
     except Exception as e:
@@ -70,37 +195,37 @@ async def groceries_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 async def _groceries_summary(conn) -> str:
     """Get grocery spending summary."""
-    # Total spend
-    total = conn.execute(
-        "SELECT SUM(price * quantity) as total, COUNT(*) as items FROM purchases"
-    ).fetchone()
-
-    # Date range
-    dates = conn.execute(
-        "SELECT MIN(date) as min_date, MAX(date) as max_date FROM purchases"
-    ).fetchone()
-
-    # By store
+    # Per-store spend plus overall totals and date range, in one table scan
     stores = conn.execute("""
-        SELECT store, SUM(price * quantity) as spend, COUNT(*) as items
+        SELECT store,
+               SUM(price * quantity) as spend,
+               COUNT(*) as items,
+               SUM(SUM(price * quantity)) OVER () as total,
+               SUM(COUNT(*)) OVER () as total_items,
+               MIN(MIN(date)) OVER () as min_date,
+               MAX(MAX(date)) OVER () as max_date
         FROM purchases GROUP BY store ORDER BY spend DESC
-    """).fetchall()
-
-    # Format
-    lines = [
-        "📊 **Grocery Summary**",
-        "",
-        f"💰 Total: **£{total['total']:,.2f}** ({total['items']} items)",
-        f"📅 {dates['min_date']} to {dates['max_date']}",
-        "",
+    """)
+
+    # First row carries the overall totals; the rest are streamed below
+    totals = stores.fetchone()
+    if totals is None:
+        return "📊 **Grocery Summary**\n\n_No purchases recorded_"
+
+    header = (
+        "📊 **Grocery Summary**\n\n"
+        f"💰 Total: **£{totals['total']:,.2f}** ({totals['total_items']} items)\n"
+        f"📅 {totals['min_date']} to {totals['max_date']}\n\n"
         "🏪 **By Store:**"
-    ]
+    )
 
-    for s in stores:
-        pct = (s['spend'] / total['total'] * 100) if total['total'] else 0
-        lines.append(f"  • {s['store']}: £{s['spend']:,.2f} ({pct:.0f}%)")
+    scale = 100 / totals['total'] if totals['total'] else 0
+    body = "\n".join(
+        f"  • {s['store']}: £{s['spend']:,.2f} ({s['spend'] * scale:.0f}%)"
+        for s in chain((totals,), stores)
+    )
 
-    return "\n".join(lines)
+    return f"{header}\n{body}"
 
 
 async def _groceries_by_store(conn) -> str:
@@ -111,38 +236,45 @@ async def _groceries_by_store(conn) -> str:
                COUNT(*) as items,
                COUNT(DISTINCT email_id) as orders
         FROM purchases GROUP BY store ORDER BY spend DESC
-    """).fetchall()
+    """)
 
     lines = ["🏪 **Spend by Store**", ""]
+    append = lines.append
     for s in stores:
         avg_order = s['spend'] / s['orders'] if s['orders'] else 0
-        lines.append(f"**{s['store']}**")
-        lines.append(f"  £{s['spend']:,.2f} | {s['orders']} orders | ~£{avg_order:.0f}/order")
+        append(f"**{s['store']}**")
+        append(f"  £{s['spend']:,.2f} | {s['orders']} orders | ~£{avg_order:.0f}/order")
 
     return "\n".join(lines)
 
 
 async def _groceries_monthly(conn) -> str:
     """Get monthly spending trend."""
+    # Last 6 months, returned oldest first, with the change on the previous
+    # month computed by SQLite rather than in Python
     monthly = conn.execute("""
-        SELECT strftime('%Y-%m', date) as month,
-               SUM(price * quantity) as spend,
-               COUNT(*) as items
-        FROM purchases
-        GROUP BY month
-        ORDER BY month DESC
-        LIMIT 6
-    """).fetchall()
+        SELECT month, spend,
+               (spend - LAG(spend) OVER w) * 100.0
+                   / NULLIF(LAG(spend) OVER w, 0) as pct
+        FROM (
+            SELECT strftime('%Y-%m', date) as month,
+                   SUM(price * quantity) as spend,
+                   COUNT(*) as items
+            FROM purchases
+            GROUP BY month
+            ORDER BY month DESC
+            LIMIT 6
+        )
+        WINDOW w AS (ORDER BY month)
+        ORDER BY month
+    """)
 
     lines = ["📈 **Monthly Trend**", ""]
-    prev_spend = None
-    for m in reversed(monthly):
-        change = ""
-        if prev_spend:
-            pct = ((m['spend'] - prev_spend) / prev_spend) * 100
-            change = f" ({'+' if pct > 0 else ''}{pct:.0f}%)"
-        lines.append(f"  {m['month']}: £{m['spend']:,.2f}{change}")
-        prev_spend = m['spend']
+    append = lines.append
+    for m in monthly:
+        pct = m['pct']
+        change = "" if pct is None else f" ({'+' if pct > 0 else ''}{pct:.0f}%)"
+        append(f"  {m['month']}: £{m['spend']:,.2f}{change}")
 
     return "\n".join(lines)
 
@@ -155,13 +287,14 @@ async def _groceries_top_products(conn) -> str:
         GROUP BY product
         ORDER BY total DESC
         LIMIT 10
-    """).fetchall()
+    """)
 
     lines = ["🏆 **Top Products by Spend**", ""]
+    append = lines.append
     for i, p in enumerate(products, 1):
         name = p['product'][:35] + "..." if len(p['product']) > 35 else p['product']
-        lines.append(f"{i}. {name}")
-        lines.append(f"   £{p['total']:,.2f} ({p['times']}x)")
+        append(f"{i}. {name}")
+        append(f"   £{p['total']:,.2f} ({p['times']}x)")
 
     return "\n".join(lines)
 
@@ -173,33 +306,58 @@ async def _groceries_recent(conn) -> str:
         FROM purchases
         ORDER BY date DESC, id DESC
         LIMIT 15
-    """).fetchall()
+    """)
 
     lines = ["🛒 **Recent Purchases**", ""]
+    append = lines.append
     current_date = None
     for r in recent:
         if r['date'] != current_date:
             current_date = r['date']
-            lines.append(f"\n**{r['date']}** ({r['store']})")
+            append(f"\n**{r['date']}** ({r['store']})")
         name = r['product'][:30] + "..." if len(r['product']) > 30 else r['product']
-        lines.append(f"  • {name} - £{r['price']:.2f}")
+        append(f"  • {name} - £{r['price']:.2f}")
 
     return "\n".join(lines)
 
 
+async def _run_command(*cmd: str, timeout: float) -> tuple[int, str, str]:
+    """Run a command without blocking the event loop.
+
+    Returns (returncode, stdout, stderr). Raises asyncio.TimeoutError after
+    killing the process if it does not finish within timeout seconds; the
+    process is also killed if the calling task is cancelled.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        # The process may have exited on its own in the meantime
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+        raise
+    return (
+        proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
 async def calendar_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /calendar command - today's schedule."""
     try:
         # Use the cal-events CLI tool
-        result = subprocess.run(
-            ["/Users/joppa/.claude/bin/cal-events", "--today"],
-            capture_output=True,
-            text=True,
-            timeout=10
+        returncode, stdout, _ = await _run_command(
+            "/Users/joppa/.claude/bin/cal-events", "--today", timeout=10
         )
 
-        if result.returncode == 0 and result.stdout.strip():
-            events = result.stdout.strip()
+        if returncode == 0 and stdout.strip():
+            events = stdout.strip()
             await update.message.reply_text(
                 f"📅 **Today's Calendar**\n\n{events}",
                 parse_mode="Markdown"
@@ -208,7 +366,7 @@ async def calendar_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             await update.message.reply_text(
                 "📅 **Today's Calendar**\n\n_No events scheduled_"
             )
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         await update.message.reply_text("⏰ Calendar query timed out")
     except FileNotFoundError:
         await update.message.reply_text(
@@ -222,26 +380,19 @@ async def calendar_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 async def reminders_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /reminders command - show Apple Reminders."""
     try:
-        # Use AppleScript to get reminders
-        script = '''
-        tell application "Reminders"
-            set output to ""
-            repeat with r in (reminders whose completed is false)
-                set output to output & "• " & name of r & "\n"
-            end repeat
-            return output
-        end tell
-        '''
-
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=10
+        # JXA fetches all pending names in one Apple Event instead of
+        # looping over reminders inside AppleScript
+        script = (
+            "Application('Reminders').reminders.whose({completed: false})"
+            ".name().map(n => '• ' + n).join('\\n')"
+        )
+
+        returncode, stdout, _ = await _run_command(
+            "osascript", "-l", "JavaScript", "-e", script, timeout=10
         )
 
-        if result.returncode == 0 and result.stdout.strip():
-            reminders = result.stdout.strip()
+        if returncode == 0 and stdout.strip():
+            reminders = stdout.strip()
             await update.message.reply_text(
                 f"✅ **Pending Reminders**\n\n{reminders}"
             )
@@ -249,7 +400,7 @@ async def reminders_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
             await update.message.reply_text(
                 "✅ **Reminders**\n\n_No pending reminders_"
             )
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         await update.message.reply_text("⏰ Reminders query timed out")
     except Exception as e:
         logger.error("Reminders command error", error=str(e))
@@ -272,41 +423,19 @@ def _parse_natural_time(text: str) -> tuple[datetime | None, str | None]:
     text = text.lower().strip()
     now = datetime.now()
 
-    # Pattern: extract time and remaining text as title
-    time_patterns = [
-        # "at HH:MM" or "at Hpm/am"
-        r'at\s+(\d{1,2}):?(\d{2})?\s*(am|pm)?',
-        # "HH:MM" standalone or "Hpm/am"
-        r'(\d{1,2}):(\d{2})\s*(am|pm)?',
-        r'(\d{1,2})\s*(am|pm)',
-    ]
-
-    # Day patterns
-    day_keywords = {
-        'today': 0,
-        'tomorrow': 1,
-        'monday': None, 'tuesday': None, 'wednesday': None,
-        'thursday': None, 'friday': None, 'saturday': None, 'sunday': None,
-    }
-
-    day_map = {
-        'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-        'friday': 4, 'saturday': 5, 'sunday': 6,
-    }
-
     # Try "in X hours" pattern
-    in_hours_match = re.search(r'in\s+(\d+)\s*hours?', text)
+    in_hours_match = _IN_HOURS_RE.search(text)
     if in_hours_match:
         hours = int(in_hours_match.group(1))
         target = now + timedelta(hours=hours)
-        title = re.sub(r'in\s+\d+\s*hours?', '', text).strip()
+        title = _IN_HOURS_RE.sub('', text).strip()
         return target, title if title else None
 
     # Find time in text
     hour, minute, period = None, 0, None
 
-    for pattern in time_patterns:
-        match = re.search(pattern, text)
+    for pattern in _TIME_PATTERNS:
+        match = pattern.search(text)
         if match:
             groups = match.groups()
             hour = int(groups[0])
@@ -334,17 +463,18 @@ def _parse_natural_time(text: str) -> tuple[datetime | None, str | None]:
     elif period == 'am' and hour == 12:
         hour = 0
 
-    # Find day reference
+    # Find day reference: tomorrow > today > weekday, wherever they appear
     target_date = now.date()
+    days = {m['day'] for m in _DAY_RE.finditer(text)}
 
-    if 'tomorrow' in text:
+    if 'tomorrow' in days:
         target_date = (now + timedelta(days=1)).date()
-    elif 'today' in text:
+    elif 'today' in days:
         target_date = now.date()
     else:
         # Check for day names
-        for day_name, weekday in day_map.items():
-            if day_name in text:
+        for day_name, weekday in _WEEKDAYS.items():
+            if day_name in days:
                 # Find next occurrence of this day
                 days_ahead = weekday - now.weekday()
                 if days_ahead <= 0:  # Target day already happened this week or is today
@@ -362,13 +492,7 @@ def _parse_natural_time(text: str) -> tuple[datetime | None, str | None]:
         return None, f"Invalid time: {e}"
 
     # Extract title (remove time/day references)
-    title = text
-    # Remove common patterns
-    title = re.sub(r'(next\s+)?(today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday)', '', title)
-    title = re.sub(r'at\s+\d{1,2}:?\d{0,2}\s*(am|pm)?', '', title)
-    title = re.sub(r'\d{1,2}:\d{2}\s*(am|pm)?', '', title)
-    title = re.sub(r'\d{1,2}\s*(am|pm)', '', title)
-    title = title.strip(' ,-:')
+    title = _STRIP_ALL_RE.sub('', text).strip(' ,-:')
 
     return target, title if title else None
 
@@ -405,7 +529,7 @@ async def schedule_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 
     # Check for --family flag
     is_family = "--family" in full_text.lower()
-    full_text = re.sub(r'--family', '', full_text, flags=re.IGNORECASE).strip()
+    full_text = _FAMILY_RE.sub('', full_text).strip()
 
     # Parse time and title
     parsed_time, title = _parse_natural_time(full_text)
@@ -433,33 +557,20 @@ async def schedule_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     end_iso = end_time.strftime("%Y-%m-%dT%H:%M:%S")
     context_type = "family" if is_family else "personal"
 
-    # Call calcom-cli
-    if not CALCOM_CLI.exists():
-        await update.message.reply_text(
-            "❌ **Cal.com CLI not found**\n\n"
-            f"Expected at: `{CALCOM_CLI}`",
-            parse_mode="Markdown"
-        )
-        return
-
+    # Call calcom-cli (a missing binary surfaces as FileNotFoundError)
     try:
-        cmd = [
+        cmd = (
             str(CALCOM_CLI),
             "propose",
             title,
             "--start", start_iso,
             "--end", end_iso,
             "--context", context_type,
-        ]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
         )
 
-        if result.returncode == 0:
+        returncode, stdout, stderr = await _run_command(*cmd, timeout=30)
+
+        if returncode == 0:
             # Parse response for confirmation
             calendar_emoji = "👨‍👩‍👧" if is_family else "📅"
             time_str = parsed_time.strftime("%a %b %d at %H:%M")
@@ -473,15 +584,21 @@ async def schedule_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                 parse_mode="Markdown"
             )
         else:
-            error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
+            error_msg = stderr.strip() or stdout.strip() or "Unknown error"
             await update.message.reply_text(
                 f"❌ **Failed to create proposal**\n\n"
                 f"Error: {error_msg}",
                 parse_mode="Markdown"
             )
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         await update.message.reply_text("⏰ Cal.com request timed out")
+    except FileNotFoundError:
+        await update.message.reply_text(
+            "❌ **Cal.com CLI not found**\n\n"
+            f"Expected at: `{CALCOM_CLI}`",
+            parse_mode="Markdown"
+        )
     except Exception as e:
         logger.error("Schedule command error", error=str(e))
         await update.message.reply_text(f"❌ Error: {str(e)}")
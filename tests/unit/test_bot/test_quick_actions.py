@@ -0,0 +1,148 @@
+"""Tests for quick action suggestions."""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from src.bot.features.quick_actions import QuickActionManager
+
+
+@pytest.fixture
+def manager():
+    """Create quick action manager."""
+    return QuickActionManager()
+
+
+def make_session(*messages):
+    """Create a mock session with the given recent messages."""
+    session = Mock()
+    session.context = {"recent_messages": [{"content": m} for m in messages]}
+    return session
+
+
+class TestAnalyzeContext:
+    """Test context analysis from recent messages."""
+
+    async def test_no_messages(self, manager):
+        """Test default context without any clues."""
+        context = await manager._analyze_context(make_session())
+        assert context["has_code"] is True
+        assert not any(v for k, v in context.items() if k != "has_code")
+
+    async def test_keyword_flags(self, manager):
+        """Test that keywords set their context flags."""
+        context = await manager._analyze_context(
+            make_session("Run PYTEST please", "poetry add requests", "mypy errors")
+        )
+        assert context["has_tests"] is True
+        assert context["has_package_manager"] is True
+        assert context["has_dependencies"] is True
+        assert context["has_linter"] is True
+        assert context["has_formatter"] is False
+
+    async def test_overlapping_keywords(self, manager):
+        """Test that overlapping keywords are all detected."""
+        context = await manager._analyze_context(make_session("formatest"))
+        assert context["has_formatter"] is True
+        assert context["has_tests"] is True
+
+    async def test_stops_once_all_flags_set(self, manager):
+        """Test that scanning stops once every flag is set."""
+        session = make_session("pytest with poetry, black and flake8")
+        trailing = Mock()
+        session.context["recent_messages"].append(trailing)
+        context = await manager._analyze_context(session)
+        assert all(context.values())
+        trailing.get.assert_not_called()
+
+
+class TestGetSuggestions:
+    """Test suggestion filtering and ordering."""
+
+    async def test_default_suggestions(self, manager):
+        """Test suggestions without session information."""
+        actions = await manager.get_suggestions()
+        assert [a.id for a in actions] == ["optimize", "document", "refactor"]
+
+    async def test_suggestions_sorted_and_limited(self, manager):
+        """Test suggestions are ordered by priority and limited."""
+        session = make_session("pytest", "pip install", "black", "flake8")
+        actions = await manager.get_suggestions(session=session, limit=4)
+        assert [a.id for a in actions] == ["test", "install", "lint", "format"]
+
+    async def test_suggestions_cached_by_active_flags(self, manager):
+        """Test that filtered suggestions are reused for the same flags."""
+        first = await manager.get_suggestions(session=make_session("pytest"))
+        second = await manager.get_suggestions(session=make_session("unittest"))
+        assert [a.id for a in first] == [a.id for a in second]
+        assert len(manager._suggestion_cache) == 1
+
+
+class TestAnalyzeContextFromData:
+    """Test context analysis from the working directory."""
+
+    async def test_python_project(self, manager, tmp_path):
+        """Test detection of a Python project layout."""
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "pyproject.toml").write_text("")
+        context = await manager._analyze_context_from_data(
+            {"working_directory": str(tmp_path)}
+        )
+        assert context["has_tests"] is True
+        assert context["has_package_manager"] is True
+        assert context["has_linter"] is True
+        assert context["has_formatter"] is True
+
+    async def test_test_file_and_package_json(self, manager, tmp_path):
+        """Test detection from a test file and package.json."""
+        (tmp_path / "app.test.js").write_text("")
+        (tmp_path / "package.json").write_text("{}")
+        context = await manager._analyze_context_from_data(
+            {"working_directory": str(tmp_path)}
+        )
+        assert context["has_tests"] is True
+        assert context["has_dependencies"] is True
+        assert context["has_linter"] is False
+
+    async def test_missing_directory(self, manager, tmp_path):
+        """Test that a missing directory yields the default context."""
+        context = await manager._analyze_context_from_data(
+            {"working_directory": str(tmp_path / "missing")}
+        )
+        assert context["has_code"] is True
+        assert context["has_tests"] is False
+
+    async def test_directory_context_cached_by_mtime(self, manager, tmp_path):
+        """Test that directory analysis is cached until the mtime changes."""
+        session_data = {"working_directory": str(tmp_path)}
+        context = await manager._analyze_context_from_data(session_data)
+        assert context["has_tests"] is False
+        assert len(manager._dir_context_cache) == 1
+
+        (tmp_path / "tests").mkdir()
+        os.utime(tmp_path, ns=(0, 1))
+        context = await manager._analyze_context_from_data(session_data)
+        assert context["has_tests"] is True
+
+
+class TestInlineKeyboard:
+    """Test inline keyboard creation."""
+
+    def test_keyboard_layout(self, manager):
+        """Test buttons are laid out in rows of the given width."""
+        actions = [manager.actions[a] for a in ("test", "lint", "format")]
+        keyboard = manager.create_inline_keyboard(actions, columns=2)
+
+        rows = keyboard.inline_keyboard
+        assert [len(row) for row in rows] == [2, 1]
+        assert rows[0][0].text == "🧪 Run Tests"
+        assert rows[0][0].callback_data == "quick_action:test"
+        assert rows[1][0].callback_data == "quick_action:format"
+
+    def test_buttons_reused(self, manager):
+        """Test that prebuilt buttons are reused across keyboards."""
+        actions = [manager.actions["test"]]
+        first = manager.create_inline_keyboard(actions)
+        second = manager.create_inline_keyboard(actions)
+        assert first.inline_keyboard[0][0] is second.inline_keyboard[0][0]
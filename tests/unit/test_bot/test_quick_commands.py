@@ -0,0 +1,359 @@
+"""Tests for quick command helpers."""
+
+import asyncio
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.bot.handlers import quick_commands
+from src.bot.handlers.quick_commands import _parse_natural_time
+
+
+class FixedDateTime(datetime):
+    """datetime with a fixed now() (Thursday 2026-10-15 09:30)."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 10, 15, 9, 30)
+
+
+@pytest.fixture(autouse=True)
+def fixed_now(monkeypatch):
+    """Pin the current time used by the parser."""
+    monkeypatch.setattr(quick_commands, "datetime", FixedDateTime)
+
+
+@pytest.fixture
+def groceries_db(tmp_path, monkeypatch):
+    """Create a small groceries database and point the module at it."""
+    db_path = tmp_path / "groceries.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE purchases (id INTEGER PRIMARY KEY, date TEXT, store TEXT, "
+        "product TEXT, price REAL, quantity REAL, email_id TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO purchases (date, store, product, price, quantity, email_id) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            ("2026-09-01", "Tesco", "Milk", 1.50, 2, "e1"),
+            ("2026-09-01", "Tesco", "Bread", 1.00, 1, "e1"),
+            ("2026-10-02", "Aldi", "Eggs", 3.00, 1, "e2"),
+            ("2026-10-03", "Aldi", "Milk", 1.50, 1, "e3"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(quick_commands, "GROCERIES_DB", db_path)
+    monkeypatch.setattr(quick_commands, "_GROCERIES_CONN", None)
+    monkeypatch.setattr(quick_commands, "_GROCERIES_CONN_FILE", None)
+    monkeypatch.setattr(quick_commands, "_GROCERIES_CACHE", {})
+    yield db_path
+    if quick_commands._GROCERIES_CONN is not None:
+        quick_commands._GROCERIES_CONN.close()
+
+
+def make_update():
+    """Create a mock update with an async reply."""
+    update = Mock()
+    update.message.reply_text = AsyncMock()
+    return update
+
+
+class TestParseNaturalTime:
+    """Test natural language time parsing for /schedule."""
+
+    @pytest.mark.parametrize(
+        "text,expected,title",
+        [
+            (
+                "tomorrow at 2pm Team meeting",
+                datetime(2026, 10, 16, 14, 0),
+                "team meeting",
+            ),
+            ("monday 3pm Client call", datetime(2026, 10, 19, 15, 0), "client call"),
+            ("next monday 3:30pm review", datetime(2026, 10, 19, 15, 30), "review"),
+            ("friday 10:30am Doctor", datetime(2026, 10, 16, 10, 30), "doctor"),
+            ("today at 4pm gym", datetime(2026, 10, 15, 16, 0), "gym"),
+            ("thursday 9am x", datetime(2026, 10, 15, 9, 0), "x"),
+            ("next thursday 9am x", datetime(2026, 10, 22, 9, 0), "x"),
+            ("wednesday 12am late", datetime(2026, 10, 21, 0, 0), "late"),
+            ("12pm lunch tomorrow", datetime(2026, 10, 16, 12, 0), "lunch"),
+            ("Buy milk, sunday 5 pm", datetime(2026, 10, 18, 17, 0), "buy milk"),
+            ("meeting - at 10:15", datetime(2026, 10, 15, 10, 15), "meeting"),
+            ("dinner at friday 7pm", datetime(2026, 10, 16, 19, 0), "dinner"),
+            ("call mom at tomorrow 5pm", datetime(2026, 10, 16, 17, 0), "call mom"),
+            ("10am team chat friday", datetime(2026, 10, 16, 10, 0), "team chat"),
+            (
+                "2pm format tomorrow review",
+                datetime(2026, 10, 16, 14, 0),
+                "format  review",
+            ),
+            ("team chat at friday 7pm", datetime(2026, 10, 16, 19, 0), "team chat"),
+            ("sunday roast tomorrow 5pm", datetime(2026, 10, 16, 17, 0), "roast"),
+            (
+                "lunch today 1pm then tomorrow",
+                datetime(2026, 10, 16, 13, 0),
+                "lunch   then",
+            ),
+        ],
+    )
+    def test_parse_day_and_time(self, text, expected, title):
+        """Test day/time expressions and title extraction."""
+        parsed, parsed_title = _parse_natural_time(text)
+        assert parsed == expected
+        assert parsed_title == title
+
+    def test_parse_in_hours(self):
+        """Test relative 'in X hours' expressions."""
+        parsed, title = _parse_natural_time("in 2 hours standup")
+        assert parsed == datetime(2026, 10, 15, 11, 30)
+        assert title == "standup"
+
+    def test_parse_without_title(self):
+        """Test that a missing title is returned as None."""
+        parsed, title = _parse_natural_time("in 1 hour")
+        assert parsed == datetime(2026, 10, 15, 10, 30)
+        assert title is None
+
+    def test_parse_no_time(self):
+        """Test error message when no time is found."""
+        parsed, error = _parse_natural_time("nothing here")
+        assert parsed is None
+        assert "Couldn't find a time" in error
+
+    def test_parse_invalid_time(self):
+        """Test error message for an out-of-range hour."""
+        parsed, error = _parse_natural_time("sunday at 25:00 bad")
+        assert parsed is None
+        assert error.startswith("Invalid time")
+
+
+class TestGroceriesCommand:
+    """Test /groceries against a local database."""
+
+    async def test_summary(self, groceries_db):
+        """Test the default summary output."""
+        update = make_update()
+        await quick_commands.groceries_command(update, Mock(args=[]))
+
+        text = update.message.reply_text.call_args.args[0]
+        assert "Total: **£8.50** (4 items)" in text
+        assert "2026-09-01 to 2026-10-03" in text
+        assert "  • Aldi: £4.50 (53%)" in text
+        assert "  • Tesco: £4.00 (47%)" in text
+
+    async def test_monthly_trend(self, groceries_db):
+        """Test month-over-month change in the monthly trend."""
+        update = make_update()
+        await quick_commands.groceries_command(update, Mock(args=["month"]))
+
+        text = update.message.reply_text.call_args.args[0]
+        assert "  2026-09: £4.00\n  2026-10: £4.50 (+12%)" in text
+
+    async def test_summary_empty_database(self, groceries_db):
+        """Test the summary when no purchases are recorded."""
+        conn = sqlite3.connect(groceries_db)
+        conn.execute("DELETE FROM purchases")
+        conn.commit()
+        conn.close()
+
+        update = make_update()
+        await quick_commands.groceries_command(update, Mock(args=["summary"]))
+
+        text = update.message.reply_text.call_args.args[0]
+        assert "No purchases recorded" in text
+
+    async def test_missing_database(self, tmp_path, monkeypatch):
+        """Test the reply when the database file does not exist."""
+        monkeypatch.setattr(quick_commands, "GROCERIES_DB", tmp_path / "missing.db")
+        update = make_update()
+        await quick_commands.groceries_command(update, Mock(args=[]))
+
+        text = update.message.reply_text.call_args.args[0]
+        assert "Grocery Database Not Found" in text
+
+    async def test_connection_is_shared_and_read_only(self, groceries_db):
+        """Test that the connection is reused and rejects writes."""
+        conn = quick_commands._get_groceries_conn(groceries_db.stat())
+        assert quick_commands._get_groceries_conn(groceries_db.stat()) is conn
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM purchases")
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] > 0
+
+    async def test_reconnects_when_database_replaced(self, groceries_db):
+        """Test that an atomically replaced database file is picked up."""
+        update = make_update()
+        await quick_commands.groceries_command(update, Mock(args=["top"]))
+        assert "£4.50" in update.message.reply_text.call_args.args[0]
+
+        new_db = groceries_db.with_name("new.db")
+        conn = sqlite3.connect(groceries_db)
+        conn.execute("VACUUM INTO ?", (str(new_db),))
+        conn.close()
+        conn = sqlite3.connect(new_db)
+        conn.execute("UPDATE purchases SET price = 99.0")
+        conn.commit()
+        conn.close()
+        os.replace(new_db, groceries_db)
+
+        await quick_commands.groceries_command(update, Mock(args=["top"]))
+        assert "£297.00" in update.message.reply_text.call_args.args[0]
+
+    async def test_cache_misses_when_replaced_with_same_mtime(self, groceries_db):
+        """Test that a replaced file is re-queried even if its mtime matches."""
+        update = make_update()
+        os.utime(groceries_db, ns=(1, 1))
+        await quick_commands.groceries_command(update, Mock(args=["top"]))
+
+        new_db = groceries_db.with_name("new.db")
+        conn = sqlite3.connect(groceries_db)
+        conn.execute("VACUUM INTO ?", (str(new_db),))
+        conn.close()
+        conn = sqlite3.connect(new_db)
+        conn.execute("UPDATE purchases SET product = 'Oat milk'")
+        conn.commit()
+        conn.close()
+        os.utime(new_db, ns=(1, 1))
+        os.replace(new_db, groceries_db)
+
+        await quick_commands.groceries_command(update, Mock(args=["top"]))
+        assert "Oat milk" in update.message.reply_text.call_args.args[0]
+
+    async def test_indexes_created_on_first_connect(self, groceries_db):
+        """Test that covering indexes are added to a writable database."""
+        conn = quick_commands._get_groceries_conn(groceries_db.stat())
+        names = {
+            row["name"]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+        assert {
+            "idx_purchases_store",
+            "idx_purchases_date",
+            "idx_purchases_product",
+        } <= names
+
+    async def test_indexes_not_rebuilt_when_present(self, groceries_db):
+        """Test that ANALYZE is skipped once the indexes exist."""
+        quick_commands._ensure_groceries_indexes()
+        conn = sqlite3.connect(groceries_db)
+        conn.execute("DELETE FROM sqlite_stat1")
+        conn.commit()
+        conn.close()
+
+        quick_commands._ensure_groceries_indexes()
+
+        conn = sqlite3.connect(groceries_db)
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] == 0
+        conn.close()
+
+    async def test_results_cached_until_database_changes(self, groceries_db):
+        """Test that replies are cached per database mtime."""
+        update = make_update()
+        os.utime(groceries_db, ns=(1, 1))
+        await quick_commands.groceries_command(update, Mock(args=["top"]))
+        first = update.message.reply_text.call_args.args[0]
+
+        conn = sqlite3.connect(groceries_db)
+        conn.execute("UPDATE purchases SET product = 'Oat milk'")
+        conn.commit()
+        conn.close()
+
+        # Same mtime: the cached reply is served
+        os.utime(groceries_db, ns=(1, 1))
+        await quick_commands.groceries_command(update, Mock(args=["top"]))
+        assert update.message.reply_text.call_args.args[0] == first
+
+        # New mtime: the query runs again
+        os.utime(groceries_db, ns=(2, 2))
+        await quick_commands.groceries_command(update, Mock(args=["top"]))
+        assert "Oat milk" in update.message.reply_text.call_args.args[0]
+
+
+class TestScheduleCommand:
+    """Test /schedule error handling."""
+
+    async def test_missing_cli(self, tmp_path, monkeypatch):
+        """Test the reply when the Cal.com CLI is not installed."""
+        monkeypatch.setattr(quick_commands, "CALCOM_CLI", tmp_path / "calcom-cli")
+        update = make_update()
+        await quick_commands.schedule_command(
+            update, Mock(args=["tomorrow", "at", "2pm", "Team", "meeting"])
+        )
+
+        text = update.message.reply_text.call_args.args[0]
+        assert "Cal.com CLI not found" in text
+
+
+class TestRunCommand:
+    """Test non-blocking subprocess execution."""
+
+    async def test_captures_output(self):
+        """Test return code and decoded output."""
+        returncode, stdout, stderr = await quick_commands._run_command(
+            sys.executable, "-c", "print('hi')", timeout=10
+        )
+        assert returncode == 0
+        assert stdout.strip() == "hi"
+        assert stderr == ""
+
+    async def test_timeout(self):
+        """Test that a slow command times out."""
+        with pytest.raises(asyncio.TimeoutError):
+            await quick_commands._run_command(
+                sys.executable, "-c", "import time; time.sleep(5)", timeout=0.1
+            )
+
+    async def test_timeout_after_process_exited(self, monkeypatch):
+        """Test that a process exiting just before kill still times out."""
+        proc = Mock()
+        proc.communicate = AsyncMock(side_effect=asyncio.TimeoutError)
+        proc.kill = Mock(side_effect=ProcessLookupError)
+        proc.wait = AsyncMock(return_value=0)
+        monkeypatch.setattr(
+            asyncio, "create_subprocess_exec", AsyncMock(return_value=proc)
+        )
+
+        with pytest.raises(asyncio.TimeoutError):
+            await quick_commands._run_command("cal-events", timeout=1)
+        proc.wait.assert_awaited_once()
+
+    async def test_cancel_kills_process(self, tmp_path):
+        """Test that cancelling the caller kills the child process."""
+        marker = tmp_path / "done"
+        task = asyncio.create_task(
+            quick_commands._run_command(
+                sys.executable,
+                "-c",
+                f"import time; time.sleep(1); open({str(marker)!r}, 'w')",
+                timeout=10,
+            )
+        )
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(1.2)
+        assert not marker.exists()
+
+    async def test_invalid_utf8_output(self):
+        """Test that undecodable output is replaced rather than raising."""
+        returncode, stdout, _ = await quick_commands._run_command(
+            sys.executable,
+            "-c",
+            "import sys; sys.stdout.buffer.write(b'ok \\xff')",
+            timeout=10,
+        )
+        assert returncode == 0
+        assert stdout == "ok \ufffd"
+
+    async def test_missing_executable(self):
+        """Test that a missing executable raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await quick_commands._run_command("/nonexistent/cli", timeout=1)